@@ -1,5 +1,6 @@
 """Setup script for aeg - builds CFFI extension with libaegis C library."""
 
+import re
 import sys
 import sysconfig
 from pathlib import Path
@@ -11,8 +12,51 @@ libaegis_static = Path("libaegis/zig-out/lib") / (
     "aegis.lib" if sys.platform == "win32" else "libaegis.a"
 )
 
+CDEF = (Path(__file__).parent / "src/aeg/aegis_cdef.h").read_text()
+
+# Variants as declared in the generated cdef, the same source as the Python modules
+VARIANTS = re.findall(r"^int (\w+)_encrypt_detached\(", CDEF, re.MULTILINE)
+
+# Helpers compiled into the extension on top of the libaegis API
+BATCH_CDEF = """
+int {v}_encrypt_detached_batch(size_t n, uint8_t *c, uint8_t *mac, size_t maclen,
+                               const uint8_t *m, const size_t *mlen,
+                               const uint8_t *ad, const size_t *adlen,
+                               const uint8_t *npub, const uint8_t *k);
+"""
+# Inputs and outputs are packed back to back, each call advances past its item
+BATCH_SOURCE = """
+#define AEG_ENCRYPT_DETACHED_BATCH(v)                                               \\
+    static int v##_encrypt_detached_batch(                                          \\
+        size_t n, uint8_t *c, uint8_t *mac, size_t maclen, const uint8_t *m,        \\
+        const size_t *mlen, const uint8_t *ad, const size_t *adlen,                 \\
+        const uint8_t *npub, const uint8_t *k)                                      \\
+    {                                                                               \\
+        size_t i;                                                                   \\
+        for (i = 0; i < n; i++) {                                                   \\
+            if (v##_encrypt_detached(c, mac, maclen, m, mlen[i], ad, adlen[i],      \\
+                                     npub, k) != 0)                                 \\
+                return -1;                                                          \\
+            c += mlen[i];                                                           \\
+            m += mlen[i];                                                           \\
+            mac += maclen;                                                          \\
+            ad += adlen[i];                                                         \\
+            npub += v##_NPUBBYTES;                                                  \\
+            k += v##_KEYBYTES;                                                      \\
+        }                                                                           \\
+        return 0;                                                                   \\
+    }
+"""
+
+# libc functions used by aeg.util
+LIBC_CDEF = """
+void *memset(void *s, int c, size_t n);
+"""
+
 ffibuilder = FFI()
-ffibuilder.cdef((Path(__file__).parent / "src/aeg/aegis_cdef.h").read_text())
+ffibuilder.cdef(CDEF)
+ffibuilder.cdef("".join(BATCH_CDEF.format(v=v) for v in VARIANTS))
+ffibuilder.cdef(LIBC_CDEF)
 
 # Free-threaded Python does not support Limited API (abi3)
 is_free_threaded = sysconfig.get_config_var("Py_GIL_DISABLED")
@@ -20,14 +64,12 @@ is_free_threaded = sysconfig.get_config_var("Py_GIL_DISABLED")
 ffibuilder.set_source(
     "aeg._aegis",
     """
+    #include <string.h>
     #include "aegis.h"
-    #include "aegis128l.h"
-    #include "aegis128x2.h"
-    #include "aegis128x4.h"
-    #include "aegis256.h"
-    #include "aegis256x2.h"
-    #include "aegis256x4.h"
-    """,
+    """
+    + "".join(f'#include "{v}.h"\n' for v in VARIANTS)
+    + BATCH_SOURCE
+    + "".join(f"AEG_ENCRYPT_DETACHED_BATCH({v})\n" for v in VARIANTS),
     include_dirs=["libaegis/src/include"],
     extra_objects=[str(libaegis_static.resolve())],
     py_limited_api=not is_free_threaded,
@@ -1,7 +1,14 @@
 """Loader for libaegis CFFI extension module."""
 
+import warnings
+
 from aeg._aegis import ffi, lib
 
 __all__ = ["ffi", "lib"]
 
-lib.aegis_init()
+# Idempotent in libaegis itself, and this module body only runs once per process
+if lib.aegis_init() != 0:
+    warnings.warn(
+        "libaegis could not select CPU-specific implementations, expect lower speed",
+        RuntimeWarning,
+    )
@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Protocol
 
 if TYPE_CHECKING:
@@ -59,6 +60,15 @@ class Cipher(Protocol):
         mac_into: "Buffer | None" = None,
     ) -> tuple[bytearray | memoryview, bytearray | memoryview]: ...
     @staticmethod
+    def encrypt_detached_batch(
+        keys: "Sequence[Buffer]",
+        nonces: "Sequence[Buffer]",
+        messages: "Sequence[Buffer]",
+        ads: "Sequence[Buffer | None] | None" = None,
+        *,
+        maclen: int = ...,
+    ) -> list[tuple[memoryview, memoryview]]: ...
+    @staticmethod
     def decrypt_detached(
         key: "Buffer",
         nonce: "Buffer",
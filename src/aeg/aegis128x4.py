@@ -4,11 +4,13 @@
 
 import errno
 import secrets
+from collections.abc import Sequence
+from itertools import accumulate, pairwise
 from typing import Literal
 
 from ._loader import ffi
 from ._loader import lib as _lib
-from .util import Buffer, new_aligned_struct, nonce_increment, wipe
+from .util import Buffer, _join_buffers, new_aligned_struct, nonce_increment, wipe
 
 NAME = "AEGIS-128X4"  #: Algorithm display name
 KEYBYTES = 16  #: Key size in bytes (varies by algorithm)
@@ -18,6 +20,27 @@ MACBYTES_LONG = 32  #: Long MAC size (always 32)
 ALIGNMENT = 64  #: Required alignment for internal structures
 RATE = 64  #: Byte chunk size in internal processing
 
+# C functions bound once at import to skip the lib attribute lookup on each call
+_c_encrypt_detached = _lib.aegis128x4_encrypt_detached
+_c_encrypt_detached_batch = _lib.aegis128x4_encrypt_detached_batch
+_c_decrypt_detached = _lib.aegis128x4_decrypt_detached
+_c_encrypt = _lib.aegis128x4_encrypt
+_c_decrypt = _lib.aegis128x4_decrypt
+_c_stream = _lib.aegis128x4_stream
+_c_encrypt_unauthenticated = _lib.aegis128x4_encrypt_unauthenticated
+_c_decrypt_unauthenticated = _lib.aegis128x4_decrypt_unauthenticated
+_c_mac_init = _lib.aegis128x4_mac_init
+_c_mac_reset = _lib.aegis128x4_mac_reset
+_c_mac_state_clone = _lib.aegis128x4_mac_state_clone
+_c_mac_update = _lib.aegis128x4_mac_update
+_c_mac_final = _lib.aegis128x4_mac_final
+_c_mac_verify = _lib.aegis128x4_mac_verify
+_c_state_init = _lib.aegis128x4_state_init
+_c_state_encrypt_update = _lib.aegis128x4_state_encrypt_update
+_c_state_encrypt_final = _lib.aegis128x4_state_encrypt_final
+_c_state_decrypt_update = _lib.aegis128x4_state_decrypt_update
+_c_state_decrypt_final = _lib.aegis128x4_state_decrypt_final
+
 
 def random_key() -> bytearray:
     """
@@ -40,8 +63,22 @@ def random_nonce() -> bytearray:
     return bytearray(secrets.token_bytes(NONCEBYTES))
 
 
+_from_buffer = ffi.from_buffer
+_CHAR_ARRAY = ffi.typeof("char[]")
+
+
 def _ptr(buf):
-    return ffi.NULL if buf is None else ffi.from_buffer(buf)
+    return ffi.NULL if buf is None else _from_buffer(buf)
+
+
+def _out_ptr(buf):
+    try:
+        # Positional arguments, as keyword parsing would double the cost of the call
+        return _from_buffer(_CHAR_ARRAY, buf, True)
+    except BufferError:
+        if memoryview(buf).readonly:
+            raise TypeError("output buffer must be writable") from None
+        raise  # Not C-contiguous
 
 
 def encrypt_detached(
@@ -101,27 +138,99 @@ def encrypt_detached(
             raise TypeError("mac_into length must be at least maclen")
         mac = mac_into
 
-    rc = _lib.aegis128x4_encrypt_detached(
-        ffi.from_buffer(c),
-        ffi.from_buffer(mac),
+    rc = _c_encrypt_detached(
+        _out_ptr(c),
+        _out_ptr(mac),
         maclen,
-        _ptr(message),
+        _from_buffer(message),
         message.nbytes,
         _ptr(ad),
         0 if ad is None else ad.nbytes,
-        _ptr(nonce),
-        _ptr(key),
+        _from_buffer(nonce),
+        _from_buffer(key),
     )
     if rc != 0:
         err_num = ffi.errno
         err_name = errno.errorcode.get(err_num, f"errno_{err_num}")
         raise RuntimeError(f"encrypt detached failed: {err_name}")
     return (
-        c if ct_into is None else memoryview(c)[: message.nbytes],
-        mac if mac_into is None else memoryview(mac)[:maclen],
+        c if ct_into is None else c[: message.nbytes],
+        mac if mac_into is None else mac[:maclen],
     )  # type: ignore
 
 
+def encrypt_detached_batch(
+    keys: Sequence[Buffer],
+    nonces: Sequence[Buffer],
+    messages: Sequence[Buffer],
+    ads: Sequence[Buffer | None] | None = None,
+    *,
+    maclen: int = MACBYTES,
+) -> list[tuple[memoryview, memoryview]]:
+    """Encrypt many messages with detached MACs in a single call into the C library.
+
+    Equivalent to encrypt_detached() on each (key, nonce, message, ad) in turn.
+    The inputs are packed into contiguous buffers so that the per-message work is
+    done in C, which is faster for large numbers of short messages.
+
+    Args:
+        keys: Secret key for each message.
+        nonces: Public nonce for each message (unique for each use).
+        messages: The plaintext messages to encrypt.
+        ads: Associated data for each message, None items for none (optional).
+        maclen: MAC length (16 or 32, default 16).
+
+    Returns:
+        List of (ciphertext, mac) tuples in input order. These are views into
+        one shared ciphertext buffer and one shared MAC buffer.
+
+    Raises:
+        TypeError: If lengths are invalid.
+        RuntimeError: If encryption fails.
+    """
+    if maclen not in (16, 32):
+        raise TypeError("maclen must be 16 or 32")
+    n = len(messages)
+    key_buf, key_lens = _join_buffers(keys)
+    nonce_buf, nonce_lens = _join_buffers(nonces)
+    m_buf, m_lens = _join_buffers(messages)
+    if ads is None:
+        ad_buf, ad_lens = b"", [0] * n
+    else:
+        ad_buf, ad_lens = _join_buffers([b"" if ad is None else ad for ad in ads])
+    if not len(key_lens) == len(nonce_lens) == len(ad_lens) == n:
+        raise TypeError("keys, nonces, messages and ads must have the same length")
+    if key_lens.count(KEYBYTES) != n:
+        raise TypeError(f"key length must be {KEYBYTES}")
+    if nonce_lens.count(NONCEBYTES) != n:
+        raise TypeError(f"nonce length must be {NONCEBYTES}")
+
+    c = bytearray(len(m_buf))
+    mac = bytearray(n * maclen)
+    rc = _c_encrypt_detached_batch(
+        n,
+        _out_ptr(c),
+        _out_ptr(mac),
+        maclen,
+        _from_buffer(m_buf),
+        m_lens,
+        _from_buffer(ad_buf),
+        ad_lens,
+        _from_buffer(nonce_buf),
+        _from_buffer(key_buf),
+    )
+    if rc != 0:
+        err_num = ffi.errno
+        err_name = errno.errorcode.get(err_num, f"errno_{err_num}")
+        raise RuntimeError(f"encrypt detached batch failed: {err_name}")
+    c = memoryview(c)
+    mac = memoryview(mac)
+    offsets = list(accumulate(m_lens, initial=0))
+    cts = [c[start:end] for start, end in pairwise(offsets)]
+    macs = [mac[i : i + maclen] for i in range(0, n * maclen, maclen)]
+    return list(zip(cts, macs))
+
+
 def decrypt_detached(
     key: Buffer,
     nonce: Buffer,
@@ -170,20 +279,20 @@ def decrypt_detached(
             raise TypeError("into length must be at least ct.nbytes")
         out = into
 
-    rc = _lib.aegis128x4_decrypt_detached(
-        ffi.from_buffer(out),
-        _ptr(ct),
+    rc = _c_decrypt_detached(
+        _out_ptr(out),
+        _from_buffer(ct),
         ct.nbytes,
-        _ptr(mac),
+        _from_buffer(mac),
         maclen,
         _ptr(ad),
         0 if ad is None else ad.nbytes,
-        _ptr(nonce),
-        _ptr(key),
+        _from_buffer(nonce),
+        _from_buffer(key),
     )
     if rc != 0:
         raise ValueError("authentication failed")
-    return out if into is None else memoryview(out)[: ct.nbytes]  # type: ignore
+    return out if into is None else out[: ct.nbytes]  # type: ignore
 
 
 def encrypt(
@@ -232,21 +341,21 @@ def encrypt(
             raise TypeError("into length must be at least message.nbytes + maclen")
         out = into
 
-    rc = _lib.aegis128x4_encrypt(
-        ffi.from_buffer(out),
+    rc = _c_encrypt(
+        _out_ptr(out),
         maclen,
-        _ptr(message),
+        _from_buffer(message),
         message.nbytes,
         _ptr(ad),
         0 if ad is None else ad.nbytes,
-        _ptr(nonce),
-        _ptr(key),
+        _from_buffer(nonce),
+        _from_buffer(key),
     )
     if rc != 0:
         err_num = ffi.errno
         err_name = errno.errorcode.get(err_num, f"errno_{err_num}")
         raise RuntimeError(f"encrypt failed: {err_name}")
-    return out if into is None else memoryview(out)[: message.nbytes + maclen]  # type: ignore
+    return out if into is None else out[: message.nbytes + maclen]  # type: ignore
 
 
 def decrypt(
@@ -298,19 +407,19 @@ def decrypt(
             raise TypeError("into length must be at least ct.nbytes - maclen")
         out = into
 
-    rc = _lib.aegis128x4_decrypt(
-        ffi.from_buffer(out),
-        _ptr(ct),
+    rc = _c_decrypt(
+        _out_ptr(out),
+        _from_buffer(ct),
         ct.nbytes,
         maclen,
         _ptr(ad),
         0 if ad is None else ad.nbytes,
-        _ptr(nonce),
-        _ptr(key),
+        _from_buffer(nonce),
+        _from_buffer(key),
     )
     if rc != 0:
         raise ValueError("authentication failed")
-    return out if into is None else memoryview(out)[:expected_out]  # type: ignore
+    return out if into is None else out[:expected_out]  # type: ignore
 
 
 def stream(
@@ -351,13 +460,14 @@ def stream(
         if length is not None and into.nbytes < length:
             raise TypeError("into length must be at least length")
         out = into
-    _lib.aegis128x4_stream(
-        ffi.from_buffer(out),
-        memoryview(out).nbytes,
+    nbytes = length if into is None else into.nbytes
+    _c_stream(
+        _out_ptr(out),
+        nbytes,
         _ptr(nonce),
-        _ptr(key),
+        _from_buffer(key),
     )
-    return out if into is None else memoryview(out)[: length or memoryview(out).nbytes]  # type: ignore
+    return out if into is None else out[: length or nbytes]  # type: ignore
 
 
 def encrypt_unauthenticated(
@@ -396,14 +506,14 @@ def encrypt_unauthenticated(
         if into.nbytes < message.nbytes:
             raise TypeError("into length must be at least message.nbytes")
         out = into
-    _lib.aegis128x4_encrypt_unauthenticated(
-        ffi.from_buffer(out),
-        _ptr(message),
+    _c_encrypt_unauthenticated(
+        _out_ptr(out),
+        _from_buffer(message),
         message.nbytes,
-        _ptr(nonce),
-        _ptr(key),
+        _from_buffer(nonce),
+        _from_buffer(key),
     )
-    return out if into is None else memoryview(out)[: message.nbytes]  # type: ignore
+    return out if into is None else out[: message.nbytes]  # type: ignore
 
 
 def decrypt_unauthenticated(
@@ -442,14 +552,14 @@ def decrypt_unauthenticated(
         if into.nbytes < ct.nbytes:
             raise TypeError("into length must be at least ct.nbytes")
         out = into
-    _lib.aegis128x4_decrypt_unauthenticated(
-        ffi.from_buffer(out),
-        _ptr(ct),
+    _c_decrypt_unauthenticated(
+        _out_ptr(out),
+        _from_buffer(ct),
         ct.nbytes,
-        _ptr(nonce),
-        _ptr(key),
+        _from_buffer(nonce),
+        _from_buffer(key),
     )
-    return out if into is None else memoryview(out)[: ct.nbytes]  # type: ignore
+    return out if into is None else out[: ct.nbytes]  # type: ignore
 
 
 # This is missing from C API but convenient to have here
@@ -472,14 +582,37 @@ def mac(
     Returns:
         MAC bytes as bytearray if into not provided, memoryview of into otherwise
     """
+    if maclen not in (16, 32):
+        raise TypeError("maclen must be 16 or 32")
     key = memoryview(key)
     nonce = memoryview(nonce)
     data = memoryview(data)
-    if into is not None:
+    if key.nbytes != KEYBYTES:
+        raise TypeError(f"key length must be {KEYBYTES}")
+    if nonce.nbytes != NONCEBYTES:
+        raise TypeError(f"nonce length must be {NONCEBYTES}")
+    if into is None:
+        out = bytearray(maclen)
+    else:
         into = memoryview(into)
-    mac_state = Mac(key, nonce, maclen)
-    mac_state.update(data)
-    return mac_state.final(into)
+        if into.nbytes < maclen:
+            raise TypeError("into length must be at least maclen")
+        out = into
+
+    # A single state finalized directly, without the clone that Mac.final() needs
+    state = new_aligned_struct("aegis128x4_mac_state", ALIGNMENT)
+    _c_mac_init(state.ptr, _from_buffer(key), _from_buffer(nonce))
+    rc = _c_mac_update(state.ptr, _from_buffer(data), data.nbytes)
+    if rc != 0:
+        err_num = ffi.errno
+        err_name = errno.errorcode.get(err_num, f"errno_{err_num}")
+        raise RuntimeError(f"mac update failed: {err_name}")
+    rc = _c_mac_final(state.ptr, _out_ptr(out), maclen)
+    if rc != 0:
+        err_num = ffi.errno
+        err_name = errno.errorcode.get(err_num, f"errno_{err_num}")
+        raise RuntimeError(f"mac final failed: {err_name}")
+    return out if into is None else out[:maclen]  # type: ignore
 
 
 class Mac:
@@ -517,12 +650,12 @@ class Mac:
 
         self._maclen = maclen
         self._proxy = new_aligned_struct("aegis128x4_mac_state", ALIGNMENT)
-        _lib.aegis128x4_mac_init(self._proxy.ptr, _ptr(key), _ptr(nonce))
+        _c_mac_init(self._proxy.ptr, _from_buffer(key), _from_buffer(nonce))
         self._cached_digest: None | Literal[False] | bytes = None
 
     def reset(self) -> None:
         """Reset back to the original state, prior to any updates."""
-        _lib.aegis128x4_mac_reset(self._proxy.ptr)
+        _c_mac_reset(self._proxy.ptr)
         self._cached_digest = None
 
     def clone(self) -> "Mac":
@@ -530,7 +663,7 @@ class Mac:
         clone = object.__new__(Mac)
         clone._maclen = self._maclen
         clone._proxy = new_aligned_struct("aegis128x4_mac_state", ALIGNMENT)
-        _lib.aegis128x4_mac_state_clone(clone._proxy.ptr, self._proxy.ptr)
+        _c_mac_state_clone(clone._proxy.ptr, self._proxy.ptr)
         clone._cached_digest = self._cached_digest
         return clone
 
@@ -544,7 +677,7 @@ class Mac:
         if self._cached_digest is not None:
             raise RuntimeError("Cannot update after final()")
         data = memoryview(data)
-        rc = _lib.aegis128x4_mac_update(self._proxy.ptr, _ptr(data), data.nbytes)
+        rc = _c_mac_update(self._proxy.ptr, _from_buffer(data), data.nbytes)
         if rc != 0:
             err_num = ffi.errno
             err_name = errno.errorcode.get(err_num, f"errno_{err_num}")
@@ -580,15 +713,13 @@ class Mac:
             out = into
 
         clone = self.clone()
-        rc = _lib.aegis128x4_mac_final(
-            clone._proxy.ptr, ffi.from_buffer(out), memoryview(out).nbytes
-        )
+        rc = _c_mac_final(clone._proxy.ptr, _out_ptr(out), maclen)
         if rc != 0:
             err_num = ffi.errno
             err_name = errno.errorcode.get(err_num, f"errno_{err_num}")
             raise RuntimeError(f"mac final failed: {err_name}")
         self._cached_digest = False
-        return out if into is None else memoryview(out)[:maclen]  # type: ignore
+        return out if into is None else out[:maclen]  # type: ignore
 
     def digest(self) -> bytes:
         """Calculate and return the MAC tag as bytes.
@@ -628,7 +759,7 @@ class Mac:
             raise TypeError("mac length must be 16 or 32")
 
         cloned = self.clone()
-        rc = _lib.aegis128x4_mac_verify(cloned._proxy.ptr, _ptr(mac), maclen)
+        rc = _c_mac_verify(cloned._proxy.ptr, _from_buffer(mac), maclen)
         if rc != 0:
             raise ValueError("mac verification failed")
 
@@ -671,12 +802,12 @@ class Encryptor:
         if nonce.nbytes != NONCEBYTES:
             raise TypeError(f"nonce length must be {NONCEBYTES}")
         self._state = new_aligned_struct("aegis128x4_state", ALIGNMENT)
-        _lib.aegis128x4_state_init(
+        _c_state_init(
             self._state.ptr,
-            _ptr(ad) if ad is not None else ffi.NULL,
+            _ptr(ad),
             0 if ad is None else ad.nbytes,
-            _ptr(nonce),
-            _ptr(key),
+            _from_buffer(nonce),
+            _from_buffer(key),
         )
         self._maclen = maclen
 
@@ -699,26 +830,27 @@ class Encryptor:
         if self._state is None:
             raise RuntimeError("Cannot call update() after final()")
         message = memoryview(message)
-        if into is not None:
-            into = memoryview(into)
         expected_out = message.nbytes
-        out = into if into is not None else bytearray(expected_out)
-        out_mv = memoryview(out)
-        if out_mv.nbytes < expected_out:
-            raise TypeError(
-                "into length must be >= expected output size for this update"
-            )
-        rc = _lib.aegis128x4_state_encrypt_update(
+        if into is None:
+            out = bytearray(expected_out)
+        else:
+            into = memoryview(into)
+            if into.nbytes < expected_out:
+                raise TypeError(
+                    "into length must be >= expected output size for this update"
+                )
+            out = into
+        rc = _c_state_encrypt_update(
             self._state.ptr,
-            ffi.from_buffer(out_mv),
-            _ptr(message),
+            _out_ptr(out),
+            _from_buffer(message),
             message.nbytes,
         )
         if rc != 0:
             err_num = ffi.errno
             err_name = errno.errorcode.get(err_num, f"errno_{err_num}")
             raise RuntimeError(f"state encrypt update failed: {err_name}")
-        return out if into is None else memoryview(out)[:expected_out]  # type: ignore
+        return out if into is None else out[:expected_out]  # type: ignore
 
     def final(self, into: Buffer | None = None) -> bytearray | memoryview:
         """Finalize encryption and return the authentication tag.
@@ -739,9 +871,9 @@ class Encryptor:
         if into is not None:
             into = memoryview(into)
         out = into if into is not None else bytearray(maclen)
-        rc = _lib.aegis128x4_state_encrypt_final(
+        rc = _c_state_encrypt_final(
             self._state.ptr,
-            ffi.from_buffer(out),
+            _out_ptr(out),
             maclen,
         )
         if rc != 0:
@@ -749,7 +881,7 @@ class Encryptor:
             err_name = errno.errorcode.get(err_num, f"errno_{err_num}")
             raise RuntimeError(f"state encrypt final failed: {err_name}")
         self._state = None
-        return out if into is None else memoryview(out)[:maclen]  # type: ignore
+        return out if into is None else out[:maclen]  # type: ignore
 
 
 class Decryptor:
@@ -790,12 +922,12 @@ class Decryptor:
         if nonce.nbytes != NONCEBYTES:
             raise TypeError(f"nonce length must be {NONCEBYTES}")
         self._state = new_aligned_struct("aegis128x4_state", ALIGNMENT)
-        _lib.aegis128x4_state_init(
+        _c_state_init(
             self._state.ptr,
-            _ptr(ad) if ad is not None else ffi.NULL,
+            _ptr(ad),
             0 if ad is None else ad.nbytes,
-            _ptr(nonce),
-            _ptr(key),
+            _from_buffer(nonce),
+            _from_buffer(key),
         )
         self._maclen = maclen
 
@@ -816,24 +948,27 @@ class Decryptor:
         if self._state is None:
             raise RuntimeError("Cannot call update() after final()")
         ct = memoryview(ct)
-        if into is not None:
-            into = memoryview(into)
         expected_out = ct.nbytes
-        out = into if into is not None else bytearray(expected_out)
-        out_mv = memoryview(out)
-        if out_mv.nbytes < expected_out:
-            raise TypeError("into length must be >= required capacity for this update")
-        rc = _lib.aegis128x4_state_decrypt_update(
+        if into is None:
+            out = bytearray(expected_out)
+        else:
+            into = memoryview(into)
+            if into.nbytes < expected_out:
+                raise TypeError(
+                    "into length must be >= required capacity for this update"
+                )
+            out = into
+        rc = _c_state_decrypt_update(
             self._state.ptr,
-            ffi.from_buffer(out_mv),
-            _ptr(ct),
+            _out_ptr(out),
+            _from_buffer(ct),
             ct.nbytes,
         )
         if rc != 0:
             err_num = ffi.errno
             err_name = errno.errorcode.get(err_num, f"errno_{err_num}")
             raise RuntimeError(f"state decrypt update failed: {err_name}")
-        return out if into is None else memoryview(out)[:expected_out]  # type: ignore
+        return out if into is None else out[:expected_out]  # type: ignore
 
     def final(self, mac: Buffer) -> None:
         """Finalize decryption by verifying the MAC tag.
@@ -852,7 +987,7 @@ class Decryptor:
         mac = memoryview(mac)
         if mac.nbytes != maclen:
             raise TypeError(f"mac length must be {maclen}")
-        rc = _lib.aegis128x4_state_decrypt_final(self._state.ptr, _ptr(mac), maclen)
+        rc = _c_state_decrypt_final(self._state.ptr, _from_buffer(mac), maclen)
         if rc != 0:
             raise ValueError("authentication failed")
         self._state = None
@@ -884,6 +1019,7 @@ __all__ = [
     "wipe",
     # one-shot functions
     "encrypt_detached",
+    "encrypt_detached_batch",
     "decrypt_detached",
     "encrypt",
     "decrypt",
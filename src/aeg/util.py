@@ -4,11 +4,20 @@ Currently provides Python-side aligned allocation helpers that avoid relying
 on libc/posix_memalign. Memory is owned by Python; C code only borrows it.
 """
 
+import functools
+import struct
 from typing import Protocol
 
-from ._loader import ffi
+from ._loader import ffi, lib
 
-__all__ = ["new_aligned_struct", "aligned_address", "Buffer", "nonce_increment", "wipe"]
+__all__ = [
+    "new_aligned_buffer",
+    "new_aligned_struct",
+    "aligned_address",
+    "Buffer",
+    "nonce_increment",
+    "wipe",
+]
 
 try:
     from collections.abc import Buffer  # type: ignore
@@ -18,9 +27,32 @@ except ImportError:
         def __buffer__(self, flags: int) -> memoryview: ...
 
 
+_WIPE_MEMSET_MIN = 16384  # Buffer size from which wipe() calls memset
+_U64 = struct.Struct("<Q")
+_U64_MAX = 0xFFFFFFFFFFFFFFFF
+_UINTPTR_T = ffi.typeof("uintptr_t")
+_BYTE_TYPES = frozenset((bytes, bytearray))
+
+
 def aligned_address(obj) -> int:
     """Return the integer address of the start of a cffi array object."""
-    return int(ffi.cast("uintptr_t", ffi.addressof(obj, 0)))
+    return int(ffi.cast(_UINTPTR_T, obj))  # Arrays decay to their first element
+
+
+@functools.cache
+def _ctype_info(ctype: str) -> tuple[int, object]:
+    """Size and pointer type of ``ctype``, parsed once per type name."""
+    return ffi.sizeof(ctype), ffi.typeof(f"{ctype} *")
+
+
+def _join_buffers(buffers) -> tuple[bytes, list[int]]:
+    """Concatenate buffers into one bytes object, also returning each size in bytes."""
+    joined = b"".join(buffers)
+    if _BYTE_TYPES.issuperset(map(type, buffers)):
+        sizes = list(map(len, buffers))  # len() is the size in bytes only for these
+    else:
+        sizes = [memoryview(b).nbytes for b in buffers]
+    return joined, sizes
 
 
 class StructHolder:
@@ -29,6 +61,8 @@ class StructHolder:
     Exposes the aligned pointer as a property and wipes the buffer on deletion.
     """
 
+    __slots__ = ("_ptr", "_view")
+
     def __init__(self, ptr: object, view: memoryview):
         self._ptr = ptr
         self._view = view  # Keep memoryview slice and its bytearray alive
@@ -39,20 +73,37 @@ class StructHolder:
         return self._ptr
 
     def __del__(self):
-        wipe(self._view)
+        _wipe_ptr(self._ptr, self._view.nbytes)
         del self._ptr, self._view
 
 
-def new_aligned_struct(ctype: str, alignment: int) -> StructHolder:
-    """Allocate memory for one instance of ``ctype`` with requested alignment."""
+def new_aligned_buffer(size: int, alignment: int = 64) -> memoryview:
+    """Allocate a zero-filled writable buffer of ``size`` bytes with requested alignment.
+
+    Suitable as an ``into`` output buffer, allowing aligned SIMD stores.
+
+    Raises:
+        ValueError: If alignment is not a power of two.
+    """
+    if alignment < 1 or alignment & (alignment - 1):
+        raise ValueError("alignment must be a power of two")
     # Allocate backing storage with extra space for alignment
-    size = ffi.sizeof(ctype)
     view = memoryview(bytearray(size + alignment - 1))
     # Compute alignment offset from the base address
     offset = (-aligned_address(ffi.from_buffer(view))) & (alignment - 1)
     # Slice the memoryview to the aligned region (keeps bytearray alive)
-    view = view[offset : offset + size]
-    return StructHolder(ffi.from_buffer(f"{ctype} *", view), view)
+    return view[offset : offset + size]
+
+
+def new_aligned_struct(ctype: str, alignment: int) -> StructHolder:
+    """Allocate memory for one instance of ``ctype`` with requested alignment.
+
+    Raises:
+        ValueError: If alignment is not a power of two.
+    """
+    size, ptype = _ctype_info(ctype)
+    view = new_aligned_buffer(size, alignment)
+    return StructHolder(ffi.from_buffer(ptype, view), view)
 
 
 def nonce_increment(nonce: Buffer) -> None:
@@ -62,21 +113,47 @@ def nonce_increment(nonce: Buffer) -> None:
 
     Args:
         nonce: The nonce buffer to increment (modified in place).
+
+    Raises:
+        TypeError: If the buffer is read-only or not C-contiguous.
     """
-    n = memoryview(nonce)
-    for i in range(len(n)):
-        if n[i] < 255:
-            n[i] += 1
-            return
-        n[i] = 0
+    try:
+        (low,) = _U64.unpack_from(nonce)
+    except (struct.error, BufferError):
+        low = _U64_MAX  # Shorter than 8 bytes or not contiguous, use the slow path
+    if low != _U64_MAX:
+        # Update the low 64 bits directly, nothing carries beyond them
+        _U64.pack_into(nonce, 0, low + 1)
+        return
+    # Carry propagated by integer arithmetic rather than a Python loop over bytes
+    n = memoryview(nonce).cast("B")
+    size = n.nbytes
+    value = (int.from_bytes(n, "little") + 1) & ((1 << 8 * size) - 1)
+    n[:] = value.to_bytes(size, "little")
+
+
+def _wipe_ptr(ptr, size: int) -> None:
+    """Fill size bytes at a cffi pointer with 0xFF, skipping buffer checks."""
+    lib.memset(ptr, 0xFF, size)
 
 
 def wipe(buffer: Buffer) -> None:
     """Securely clearing sensitive data from memory. Sets all bytes of the buffer to 0xFF.
 
+    The caller's memory is overwritten in place.
+
     Args:
         buffer: The buffer to wipe (modified in place).
+
+    Raises:
+        TypeError: If the buffer is read-only or not C-contiguous.
     """
-    # This is the fastest method I have found in Python
     n = memoryview(buffer).cast("B")
-    n[:] = b"\xff" * len(n)
+    if n.nbytes < _WIPE_MEMSET_MIN:
+        # Slice assignment beats the overhead of a C call on small buffers
+        n[:] = b"\xff" * n.nbytes
+    elif n.readonly:
+        raise TypeError("cannot modify read-only memory")
+    else:
+        # A single memset in C, without a temporary bytes object of the same size
+        _wipe_ptr(ffi.from_buffer(n), n.nbytes)
@@ -1,4 +1,6 @@
+import ctypes
 import json
+from array import array
 from pathlib import Path
 
 import pytest
@@ -236,3 +238,63 @@ def test_encrypt_decrypt_incremental(vector):
             decryptor.update(ct)  # This should succeed
             with pytest.raises(ValueError, match="authentication failed"):
                 decryptor.final(invalid_mac)
+
+
+@pytest.mark.parametrize(
+    "alg",
+    [aegis128l, aegis128x2, aegis128x4, aegis256, aegis256x2, aegis256x4],
+    ids=lambda x: x.__name__.split(".")[-1],
+)
+def test_encrypt_detached_batch(alg):
+    """Test batch encryption of all valid test vectors of an algorithm at once."""
+    vectors = [
+        v
+        for v in load_encryption_test_vectors()
+        if v["_algorithm"] is alg and "msg" in v and "tag128" in v
+    ]
+    keys = [bytes.fromhex(v["key"]) for v in vectors]
+    nonces = [bytes.fromhex(v["nonce"]) for v in vectors]
+    messages = [bytes.fromhex(v["msg"]) for v in vectors]
+    ads = [bytes.fromhex(v["ad"]) if "ad" in v else None for v in vectors]
+
+    results = alg.encrypt_detached_batch(keys, nonces, messages, ads, maclen=16)
+
+    assert len(results) == len(vectors)
+    for vector, (ct, mac) in zip(vectors, results):
+        assert bytes(mac) == bytes.fromhex(vector["tag128"]), vector["name"]
+        if "ct" in vector:
+            assert bytes(ct) == bytes.fromhex(vector["ct"]), vector["name"]
+
+    with pytest.raises(TypeError):
+        alg.encrypt_detached_batch(keys, nonces[:-1], messages)
+    # Packed sizes add up, but each key still has to be exactly KEYBYTES
+    bad_keys = [bytes(alg.KEYBYTES - 1), bytes(alg.KEYBYTES + 1)]
+    with pytest.raises(TypeError):
+        alg.encrypt_detached_batch(bad_keys, nonces[:2], messages[:2])
+
+
+@pytest.mark.parametrize(
+    "alg",
+    [aegis128l, aegis128x2, aegis128x4, aegis256, aegis256x2, aegis256x4],
+    ids=lambda x: x.__name__.split(".")[-1],
+)
+def test_encrypt_detached_batch_buffer_shapes(alg):
+    """Test that batch items are split by size in bytes, not by len()."""
+    key = alg.random_key()
+    nonce = alg.random_nonce()
+    batches = [
+        # len() adds up to the total size in bytes, but not item by item
+        [
+            ((ctypes.c_uint8 * 0) * 5)(),  # len() 5, zero bytes
+            memoryview(bytes(range(6))).cast("B", shape=[1, 6]),  # len() 1, 6 bytes
+        ],
+        [array("I", [1, 2, 3]), b"plain"],  # len() 3, twelve bytes
+    ]
+    for messages in batches:
+        results = alg.encrypt_detached_batch(
+            [key] * len(messages), [nonce] * len(messages), messages
+        )
+        for message, (ct, mac) in zip(messages, results):
+            expected_ct, expected_mac = alg.encrypt_detached(key, nonce, message)
+            assert bytes(ct) == bytes(expected_ct)
+            assert bytes(mac) == bytes(expected_mac)
@@ -267,3 +267,21 @@ def test_mac_clone_preserves_cached_digest(alg):
         mac_state.update(b"More data")
     with pytest.raises(RuntimeError):
         cloned_state.update(b"More data")
+
+
+@pytest.mark.parametrize("alg", ALL_ALGORITHMS, ids=lambda x: x.__name__.split(".")[-1])
+def test_mac_into_larger_buffer(alg):
+    """Test that an oversized into buffer does not change the tag length."""
+    key = alg.random_key()
+    nonce = alg.random_nonce()
+    expected = alg.mac(key, nonce, b"Hello, world!")
+
+    out = bytearray(64)
+    tag = alg.mac(key, nonce, b"Hello, world!", into=out)
+    assert bytes(tag) == bytes(expected)
+    assert len(tag) == alg.MACBYTES
+
+    mac_state = alg.Mac(key, nonce)
+    mac_state.update(b"Hello, world!")
+    tag = mac_state.final(bytearray(64))
+    assert bytes(tag) == bytes(expected)
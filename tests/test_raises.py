@@ -1,7 +1,8 @@
 """Tests for Encryptor and Decryptor finalization behavior.
 
 This module verifies that Encryptor and Decryptor objects become unusable
-after calling final(), preventing accidental misuse.
+after calling final(), preventing accidental misuse, and that read-only
+output buffers are rejected.
 """
 
 import pytest
@@ -336,3 +337,38 @@ class TestMultipleChunksBeforeFinalization:
         # Now unusable
         with pytest.raises(RuntimeError):
             decryptor.update(b"More")
+
+
+class TestReadonlyOutput:
+    """Test that read-only output buffers are rejected instead of written to."""
+
+    @pytest.mark.parametrize(
+        "alg", ALL_ALGORITHMS, ids=lambda x: x.__name__.split(".")[-1]
+    )
+    def test_readonly_into_raises(self, alg):
+        key = alg.random_key()
+        nonce = alg.random_nonce()
+        out = bytes(64)
+
+        with pytest.raises(TypeError):
+            alg.encrypt(key, nonce, b"message", into=out)
+        with pytest.raises(TypeError):
+            alg.stream(key, nonce, into=out)
+        with pytest.raises(TypeError):
+            alg.mac(key, nonce, b"message", into=out)
+        with pytest.raises(TypeError):
+            alg.Encryptor(key, nonce).update(b"message", into=out)
+        assert out == bytes(64)
+
+    @pytest.mark.parametrize(
+        "alg", ALL_ALGORITHMS, ids=lambda x: x.__name__.split(".")[-1]
+    )
+    def test_noncontiguous_into_raises(self, alg):
+        key = alg.random_key()
+        nonce = alg.random_nonce()
+        out = memoryview(bytearray(128))[::2]
+
+        with pytest.raises(BufferError, match="contiguous"):
+            alg.encrypt(key, nonce, b"message", into=out)
+        with pytest.raises(BufferError, match="contiguous"):
+            alg.stream(key, nonce, into=out)
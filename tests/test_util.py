@@ -0,0 +1,82 @@
+import pytest
+
+from aeg import aegis128l, aegis256x4
+from aeg._loader import ffi
+from aeg.util import new_aligned_buffer, new_aligned_struct, nonce_increment, wipe
+
+
+@pytest.mark.parametrize("alg", [aegis128l, aegis256x4], ids=lambda x: x.NAME)
+def test_new_aligned_struct_alignment(alg):
+    """Test that allocated structs start at the requested alignment."""
+    for _ in range(8):
+        holder = new_aligned_struct(f"{alg.__name__.split('.')[-1]}_state", 64)
+        assert int(ffi.cast("uintptr_t", holder.ptr)) % 64 == 0
+
+
+@pytest.mark.parametrize("alignment", [0, 3, 48, -16])
+def test_new_aligned_struct_invalid_alignment(alignment):
+    """Test that alignments that are not powers of two are rejected."""
+    with pytest.raises(ValueError):
+        new_aligned_struct("aegis128l_state", alignment)
+
+
+@pytest.mark.parametrize("alignment", [1, 8, 64, 4096])
+def test_new_aligned_buffer(alignment):
+    """Test that aligned buffers are usable as into= outputs."""
+    buf = new_aligned_buffer(100, alignment)
+    assert len(buf) == 100
+    assert int(ffi.cast("uintptr_t", ffi.from_buffer(buf))) % alignment == 0
+
+    key = aegis128l.random_key()
+    out = aegis128l.stream(key, None, into=buf)
+    assert bytes(out) == bytes(aegis128l.stream(key, None, 100))
+
+
+@pytest.mark.parametrize("size", [0, 1, 32, 16383, 16384, 100_000])
+def test_wipe(size):
+    """Test that wipe() fills the whole buffer, via slicing or memset."""
+    buf = bytearray(range(256)) * (size // 256 + 1)
+    view = memoryview(buf)[1 : size + 1]
+    wipe(view)
+    assert view == b"\xff" * size
+    assert buf[0] == 0
+
+    with pytest.raises(TypeError):
+        wipe(bytes(size + 1))
+
+
+@pytest.mark.parametrize(
+    "before, after",
+    [
+        ("00000000", "01000000"),
+        ("fe000000", "ff000000"),
+        ("ff000000", "00010000"),
+        ("ffff0100", "00000200"),
+        ("ffffffff", "00000000"),
+        ("ffffffffffffffff00000000000000ff", "000000000000000001000000000000ff"),
+        ("feffffffffffffff0000000000000000", "ffffffffffffffff0000000000000000"),
+        ("ffffffffffffffffffffffffffffffff", "00000000000000000000000000000000"),
+        ("", ""),
+    ],
+)
+def test_nonce_increment(before, after):
+    """Test little-endian increment with carry and wrap-around."""
+    nonce = bytearray.fromhex(before)
+    nonce_increment(nonce)
+    assert nonce.hex() == after
+
+
+def test_nonce_increment_sequence():
+    """Test that repeated increments count like a little-endian integer."""
+    nonce = bytearray(aegis256x4.NONCEBYTES)
+    for _ in range(1000):
+        nonce_increment(nonce)
+    assert int.from_bytes(nonce, "little") == 1000
+
+
+def test_nonce_increment_invalid_buffer():
+    """Test that read-only and non-contiguous nonces are rejected."""
+    with pytest.raises(TypeError):
+        nonce_increment(bytes(16))
+    with pytest.raises(TypeError):
+        nonce_increment(memoryview(bytearray(32))[::2])
@@ -72,12 +72,11 @@ def format_declaration(decl: str, max_width: int = 100) -> str:
 
 
 def generate_cdef(include_dir: pathlib.Path) -> str:
+    # uint8_t and size_t are not declared here: CFFI knows the standard types
+    # and uses their real platform width (size_t is 64-bit on Windows x64 too)
     lines = [
         "/* This file is generated with tools/generate.py. Do not edit. */",
         "",
-        "typedef unsigned char uint8_t;",
-        "typedef unsigned long size_t;",
-        "",
     ]
 
     headers = [